@@ -10,15 +10,31 @@ Scans repository files for accidental inclusion of real data:
 Exits with code 1 if leaks are found.
 """
 
+import mmap
+import os
 import re
 import sys
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import hyperscan
+except ImportError:  # Optional: pip install amtsguide-readiness-spec[fast]
+    hyperscan = None
+
 
 # Directories to scan
 SCAN_DIRS = ["examples", "docs"]
 SCAN_FILES = ["README.md", "CHANGELOG.md"]
 
+# Files at least this large are memory-mapped rather than read into memory
+MMAP_MIN_SIZE = 1 << 20
+MMAP_CHUNK_SIZE = 1 << 20
+
+# Below this many files, process pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 32
+
 # Patterns that indicate real data (should NOT be present)
 LEAK_PATTERNS = [
     # Real German authority domains
@@ -27,8 +43,10 @@ LEAK_PATTERNS = [
     (r"\.gov\b(?!/)", "Real government domain"),  # Avoid matching example.gov/path
     (r"ba-[a-z]+\.berlin\.de", "Real Berlin district domain"),
     
-    # Real email addresses (not @example.com/org/invalid)
-    (r"[a-zA-Z0-9._%+-]+@(?!example\.(com|org|invalid))[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", 
+    # Real email addresses (example domains are filtered in pattern_matches).
+    # The lookbehind pins the match to the start of a local-part run, so a
+    # long run without "@" is scanned once instead of once per character.
+    (r"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@(?P<email_domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
      "Real email address"),
     
     # German phone numbers
@@ -37,6 +55,9 @@ LEAK_PATTERNS = [
     (r"030[\s-]?\d{3,}", "Berlin phone number (030)"),
 ]
 
+# Email domains reserved for documentation (RFC 2606)
+EXAMPLE_EMAIL_DOMAINS = ("example.com", "example.org", "example.invalid")
+
 # Patterns to allow (false positive prevention)
 ALLOW_PATTERNS = [
     r"example\.gov",
@@ -59,80 +80,363 @@ DOCUMENTATION_CONTEXT = [
     "BLOCKED",
 ]
 
+# Compiled once at import; scan_file runs these for every line of every file
+LEAK_PATTERNS_COMPILED = [
+    (re.compile(pattern, re.IGNORECASE), description)
+    for pattern, description in LEAK_PATTERNS
+]
+
+# Union of LEAK_PATTERNS, so a clean line or file costs one search
+LEAK_RE = re.compile(
+    "|".join(f"(?P<leak{i}>{p})" for i, (p, _) in enumerate(LEAK_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# Everything that makes should_skip_line() true, in one search: allowed
+# example patterns (case-insensitive), documentation phrases (case-sensitive)
+# and lines that are regex patterns (documenting the scanner itself)
+SKIP_RE = re.compile(
+    "|".join(
+        [f"(?i:{pattern})" for pattern in ALLOW_PATTERNS]
+        + [re.escape(phrase) for phrase in DOCUMENTATION_CONTEXT]
+        + [r'^\s*\(?r"']
+    )
+)
+
+# Code fences, and lines opening/closing a "bad example" section
+# (documentation showing what NOT to do)
+FENCE_RE = re.compile(r"^[^\S\n]*```", re.MULTILINE)
+BAD_START_RE = re.compile(r"DO NOT|Real \(|Bad:")
+BAD_END_RE = re.compile(r"^[^\S\n]*\*\*[^\n]*?(?:OK|Good|Synthetic)", re.MULTILINE)
+
+# Locators for pure-ASCII files, which are scanned as bytes (see read_content)
+LEAK_RE_BYTES = re.compile(LEAK_RE.pattern.encode(), re.IGNORECASE)
+FENCE_RE_BYTES = re.compile(FENCE_RE.pattern.encode(), re.MULTILINE)
+BAD_START_RE_BYTES = re.compile(BAD_START_RE.pattern.encode())
+BAD_END_RE_BYTES = re.compile(BAD_END_RE.pattern.encode(), re.MULTILINE)
+NON_ASCII_RE = re.compile(rb"[\x80-\xff]")
+
+# Line breaks str.splitlines() knows besides "\n" and "\r\n". Content with
+# any of them, or a lone "\r", is normalised before scanning so lines and
+# line numbers match read_text() + splitlines() (see normalize_line_breaks)
+OTHER_LINE_BREAKS = ("\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+# In binary content also "\x1f": whitespace to str \s and strip(), but not
+# to bytes \s, so lines with it are only scanned correctly as str
+OTHER_LINE_BREAKS_BYTES = (b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+
+
+def build_hyperscan_db():
+    """
+    Compile LEAK_PATTERNS into a Hyperscan database for binary content.
+    
+    Hyperscan has no lookarounds, so the patterns are compiled in prefilter
+    mode: it may report more hits than re would, but never fewer. Candidate
+    lines are confirmed with LEAK_PATTERNS_COMPILED either way.
+    """
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pattern.encode() for pattern, _ in LEAK_PATTERNS],
+        ids=list(range(len(LEAK_PATTERNS))),
+        elements=len(LEAK_PATTERNS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_PREFILTER] * len(LEAK_PATTERNS),
+    )
+    return db
+
+
+HYPERSCAN_DB = build_hyperscan_db()
+
+# Content of a file being scanned (see read_content)
+Content = str | bytes | mmap.mmap
+
 
 def should_skip_line(line: str) -> bool:
     """Check if line contains allowed patterns or is documentation."""
-    # Skip lines with allowed example patterns
-    for pattern in ALLOW_PATTERNS:
-        if re.search(pattern, line, re.IGNORECASE):
+    return SKIP_RE.search(line) is not None
+
+
+def pattern_matches(pattern: re.Pattern, line: str) -> bool:
+    """Check if a leak pattern matches line, ignoring example email domains."""
+    for match in pattern.finditer(line):
+        domain = match.groupdict().get("email_domain")
+        if domain is None or not domain.lower().startswith(EXAMPLE_EMAIL_DOMAINS):
             return True
+    return False
+
+
+def read_content(path: Path) -> Content:
+    """
+    Read a file for scanning.
     
-    # Skip lines that are documenting what NOT to do
-    for phrase in DOCUMENTATION_CONTEXT:
-        if phrase in line:
-            return True
+    Pure-ASCII files are scanned as raw bytes without a decode pass; bytes
+    and str regexes behave identically on ASCII apart from \\s on
+    \\x1c-\\x1f, which normalize_line_breaks hands over to str. Files of
+    MMAP_MIN_SIZE or more are memory-mapped instead of copied (the caller
+    closes the mmap).
+    Anything non-ASCII is decoded as UTF-8 so \\s, \\b and case folding
+    keep their Unicode meaning.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            data = f.read()
+            return data if data.isascii() else data.decode("utf-8")
+        
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    if not NON_ASCII_RE.search(mm):
+        return mm
+    try:
+        return str(mm, "utf-8")
+    finally:
+        mm.close()
+
+
+def line_text(content: Content, start: int, end: int) -> str:
+    """Return content[start:end] as str (binary content is pure ASCII)."""
+    line = content[start:end]
+    return line.decode("ascii") if isinstance(line, bytes) else line
+
+
+def line_bounds(content: Content, pos: int) -> tuple[int, int]:
+    """Return (start, end) offsets of the line containing pos, without the newline."""
+    newline = "\n" if isinstance(content, str) else b"\n"
+    start = content.rfind(newline, 0, pos) + 1
+    end = content.find(newline, pos)
+    if end == -1:
+        end = len(content)
+    return start, end
+
+
+def count_in(content: Content, sub: str | bytes, start: int, end: int) -> int:
+    """Count sub in content[start:end] without copying str/bytes content."""
+    if not isinstance(content, mmap.mmap):
+        return content.count(sub, start, end)
+    # mmap has no count(); copy out bounded chunks instead of the whole range.
+    # Chunks overlap by len(sub) - 1 so each match is counted in the chunk
+    # it starts in
+    overlap = len(sub) - 1
+    return sum(
+        content[pos:min(pos + MMAP_CHUNK_SIZE + overlap, end)].count(sub)
+        for pos in range(start, end, MMAP_CHUNK_SIZE)
+    )
+
+
+def count_newlines(content: Content, start: int, end: int) -> int:
+    """Count newlines in content[start:end]."""
+    return count_in(content, "\n" if isinstance(content, str) else b"\n", start, end)
+
+
+def normalize_line_breaks(content: Content) -> Content:
+    """
+    Return content whose only line breaks are "\n" and "\r\n".
+    
+    The scan splits lines on "\n" (dropping a trailing "\r"), which matches
+    str.splitlines() for LF and CRLF files. Content with any other break
+    (lone "\r", form feed, "\u2028", ...) is decoded if binary and rejoined
+    from splitlines(), so no line hides behind a break the scan ignores.
+    """
+    if isinstance(content, str):
+        cr, crlf, other_breaks = "\r", "\r\n", OTHER_LINE_BREAKS
+    else:
+        cr, crlf, other_breaks = b"\r", b"\r\n", OTHER_LINE_BREAKS_BYTES
     
-    # Skip lines that are regex patterns (documenting the scanner itself)
-    if line.strip().startswith("r\"") or line.strip().startswith("(r\""):
-        return True
+    size = len(content)
+    if all(content.find(brk) == -1 for brk in other_breaks) and (
+        content.find(cr) == -1
+        or count_in(content, cr, 0, size) == count_in(content, crlf, 0, size)
+    ):
+        return content
     
-    return False
+    text = content if isinstance(content, str) else content[:].decode("ascii")
+    return "\n".join(text.splitlines())
 
 
-def scan_file(path: Path) -> list[tuple[int, str, str]]:
+def find_fences(content: Content) -> list[int]:
+    """Return the start offsets of all code fence lines, in order."""
+    fence_re = FENCE_RE if isinstance(content, str) else FENCE_RE_BYTES
+    return [match.start() for match in fence_re.finditer(content)]
+
+
+def bad_example_ranges(content: Content, fences: list[int]) -> list[tuple[int, int]]:
     """
-    Scan a file for leak patterns.
+    Find "bad example" sections in content as sorted (start, end) ranges.
+    
+    A section starts at a line with a BAD_START_RE marker and ends before
+    the next line matching BAD_END_RE. Fence lines never open or close one.
+    """
+    if isinstance(content, str):
+        start_re, end_re = BAD_START_RE, BAD_END_RE
+    else:
+        start_re, end_re = BAD_START_RE_BYTES, BAD_END_RE_BYTES
+    
+    # line start -> True (opens section) / False (closes); opening wins
+    events: dict[int, bool] = {}
+    for match in end_re.finditer(content):
+        events[match.start()] = False
+    for match in start_re.finditer(content):
+        events[line_bounds(content, match.start())[0]] = True
+    for fence in fences:
+        events.pop(fence, None)
+    
+    ranges = []
+    section_start = None
+    for offset in sorted(events):
+        if events[offset] and section_start is None:
+            section_start = offset
+        elif not events[offset] and section_start is not None:
+            ranges.append((section_start, offset))
+            section_start = None
+    if section_start is not None:
+        ranges.append((section_start, len(content)))
+    return ranges
+
+
+class SkipRegions:
+    """Code blocks and "bad example" sections of one file, for bisect lookups."""
+    
+    def __init__(self, content: Content):
+        self.size = len(content)
+        self.fences = find_fences(content)
+        bad_ranges = bad_example_ranges(content, self.fences)
+        self.bad_starts = [start for start, _ in bad_ranges]
+        self.bad_ends = [end for _, end in bad_ranges]
+    
+    def resume_at(self, line_start: int) -> int | None:
+        """
+        Return the offset to resume scanning at if the line at line_start is
+        skipped (a fence, in a code block, or in a bad example), else None.
+        """
+        # An odd number of fences at or before the line means we're in a code block
+        idx = bisect_right(self.fences, line_start)
+        if idx % 2:
+            return self.fences[idx] if idx < len(self.fences) else self.size
+        if idx and self.fences[idx - 1] == line_start:
+            return line_start
+        
+        idx = bisect_right(self.bad_starts, line_start) - 1
+        if idx >= 0 and line_start < self.bad_ends[idx]:
+            return self.bad_ends[idx]
+        return None
+
+
+def hyperscan_ends(content: Content) -> list[int] | None:
+    """
+    Return sorted end offsets of Hyperscan leak hits in binary content.
+    
+    Returns None when Hyperscan is not installed or content is str.
+    """
+    if HYPERSCAN_DB is None or isinstance(content, str):
+        return None
+    ends: list[int] = []
+    HYPERSCAN_DB.scan(
+        content,
+        match_event_handler=lambda _id, _from, to, _flags, _context: ends.append(to),
+    )
+    ends.sort()
+    return ends
+
+
+def next_candidate(content: Content, pos: int, hs_ends: list[int] | None) -> tuple[int, int] | None:
+    """
+    Return (start, end) offsets of the next line at or after pos with a
+    possible leak, or None.
+    
+    Uses the Hyperscan hits when given, else searches with the fused leak regex.
+    """
+    if hs_ends is not None:
+        idx = bisect_left(hs_ends, pos + 1)
+        if idx == len(hs_ends):
+            return None
+        return line_bounds(content, hs_ends[idx] - 1)
+    
+    leak_re = LEAK_RE if isinstance(content, str) else LEAK_RE_BYTES
+    match = leak_re.search(content, pos)
+    if match is None:
+        return None
+    return line_bounds(content, match.start())
+
+
+def scan_content(content: Content) -> list[tuple[int, str, str]]:
+    """
+    Scan file content for leak patterns.
+    
+    Only lines with a candidate hit (see next_candidate) are checked
+    against the skip rules and individual patterns; code blocks and bad
+    examples are jumped over as a whole.
     
     Returns list of (line_number, pattern_description, line_content) tuples.
     """
     issues = []
     
-    try:
-        content = path.read_text(encoding="utf-8")
-    except Exception as e:
-        print(f"Warning: Could not read {path}: {e}", file=sys.stderr)
-        return issues
+    content = normalize_line_breaks(content)
+    regions = SkipRegions(content)
+    hs_ends = hyperscan_ends(content)
     
-    in_code_block = False
-    in_bad_example = False  # Track if we're in a "bad example" section
+    line_num = 1
+    counted_to = 0
+    pos = 0
     
-    for line_num, line in enumerate(content.splitlines(), 1):
-        # Track code blocks
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-        
-        # Track "bad example" sections (documentation showing what NOT to do)
-        if "DO NOT" in line or "Real (" in line or "Bad:" in line:
-            in_bad_example = True
-        elif line.strip().startswith("**") and ("OK" in line or "Good" in line or "Synthetic" in line):
-            in_bad_example = False
+    while candidate := next_candidate(content, pos, hs_ends):
+        start, end = candidate
+        pos = end + 1
         
-        # Skip code blocks entirely (they're examples/documentation)
-        if in_code_block:
+        # Skip code blocks and "bad example" sections
+        resume = regions.resume_at(start)
+        if resume is not None:
+            pos = max(pos, resume)
             continue
         
-        # Skip if in a "bad example" section
-        if in_bad_example:
-            continue
+        line_num += count_newlines(content, counted_to, start)
+        counted_to = start
+        line = line_text(content, start, end).removesuffix("\r")
         
         # Skip lines with allowed patterns
         if should_skip_line(line):
             continue
         
-        for pattern, description in LEAK_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
+        for pattern, description in LEAK_PATTERNS_COMPILED:
+            if pattern_matches(pattern, line):
                 issues.append((line_num, description, line.strip()[:100]))
     
     return issues
 
 
+def scan_file(path: Path) -> list[tuple[int, str, str]]:
+    """
+    Scan a file for leak patterns.
+    
+    Returns list of (line_number, pattern_description, line_content) tuples.
+    """
+    try:
+        content = read_content(path)
+    except Exception as e:
+        print(f"Warning: Could not read {path}: {e}", file=sys.stderr)
+        return []
+    
+    try:
+        return scan_content(content)
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+
+
+def scan_files(paths: list[Path]) -> list[list[tuple[int, str, str]]]:
+    """Scan files in order, using a process pool when there are enough of them."""
+    if len(paths) < PARALLEL_MIN_FILES:
+        return [scan_file(path) for path in paths]
+    
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(scan_file, paths, chunksize=16))
+
+
 def main():
     """Run leak guard scan."""
     repo_root = Path(__file__).parent.parent
     all_issues: dict[str, list] = {}
+    files: dict[str, Path] = {}
     
-    # Scan directories
+    # Collect directory files
     for dir_name in SCAN_DIRS:
         dir_path = repo_root / dir_name
         if not dir_path.exists():
@@ -140,18 +444,17 @@ def main():
         
         for file_path in dir_path.rglob("*"):
             if file_path.is_file() and file_path.suffix in [".md", ".json", ".yaml", ".yml", ".txt"]:
-                issues = scan_file(file_path)
-                if issues:
-                    rel_path = file_path.relative_to(repo_root)
-                    all_issues[str(rel_path)] = issues
+                files[str(file_path.relative_to(repo_root))] = file_path
     
-    # Scan root files
+    # Collect root files
     for file_name in SCAN_FILES:
         file_path = repo_root / file_name
         if file_path.exists():
-            issues = scan_file(file_path)
-            if issues:
-                all_issues[file_name] = issues
+            files[file_name] = file_path
+    
+    for name, issues in zip(files, scan_files(list(files.values()))):
+        if issues:
+            all_issues[name] = issues
     
     # Report results
     if all_issues:
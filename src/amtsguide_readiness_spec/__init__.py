@@ -6,11 +6,13 @@ Schemas and validators for reviewable AI work products.
 
 __version__ = "0.1.0"
 
+from .validators.result import ValidationResult
 from .validators.work_product import WorkProductValidator
 from .validators.lexicon import LexiconValidator
 from .validators.numbers import NumbersAgainstSourceValidator
 
 __all__ = [
+    "ValidationResult",
     "WorkProductValidator",
     "LexiconValidator",
     "NumbersAgainstSourceValidator",
@@ -9,6 +9,11 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from .validators.work_product import WorkProductValidator
 from .validators.lexicon import LexiconValidator
 
@@ -23,8 +28,8 @@ def load_config(config_path: str | None) -> dict:
         print(f"Warning: Config file not found: {config_path}", file=sys.stderr)
         return {}
     
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
 
 
 def validate_work_product():
@@ -1,10 +1,12 @@
 """Validators for work products and text content."""
 
+from .result import ValidationResult
 from .work_product import WorkProductValidator
 from .lexicon import LexiconValidator
 from .numbers import NumbersAgainstSourceValidator
 
 __all__ = [
+    "ValidationResult",
     "WorkProductValidator",
     "LexiconValidator",
     "NumbersAgainstSourceValidator",
@@ -9,15 +9,163 @@ Validates text content against stop rules:
 """
 
 import re
-from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, NamedTuple
 
+from .result import ValidationResult
 
-@dataclass
-class ValidationResult:
-    """Result of validation check."""
-    passed: bool
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
+try:
+    import ahocorasick
+except ImportError:  # Optional: pip install amtsguide-readiness-spec[fast]
+    ahocorasick = None
+
+
+# Text between sentence-ending punctuation
+_SENTENCE_RE = re.compile(r"[^.!?]+")
+
+# Characters of a term matched through the trie before falling back to a
+# flat alternation (see _trie_pattern)
+_MAX_TRIE_DEPTH = 64
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex definition of a word character (\\w)."""
+    return char.isalnum() or char == "_"
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    """Check for a word boundary (\\b) before text[pos]."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _find_shadowed(terms: list[str]) -> set[str]:
+    """
+    Return the terms a longer term can hide in a longest-first alternation.
+    
+    A longer term hides a shorter one only where both match whole words at
+    the same position: the shorter term is its prefix and a word boundary
+    follows the prefix ("new" in "new york", not in "newer"). In sorted
+    order the terms starting with a prefix directly follow it, so a stack of
+    the current term's prefixes finds every pair in one pass; each term has
+    at most len(term) prefixes on the stack.
+    """
+    shadowed = set()
+    prefixes: list[str] = []
+    for term in sorted(terms):
+        while prefixes and not term.startswith(prefixes[-1]):
+            prefixes.pop()
+        for prefix in prefixes:
+            if _is_boundary(term, len(prefix)):
+                shadowed.add(prefix)
+        prefixes.append(term)
+    # The empty term matches at every boundary, including inside other terms
+    if "" in terms:
+        shadowed.add("")
+    return shadowed
+
+
+def _trie_pattern(term_groups: dict[str, str]) -> str:
+    """
+    Build a regex matching any term, structured as a trie of the terms.
+    
+    Each position then costs one branch per character of the longest
+    candidate rather than one attempt per term. Longer terms are tried
+    before the terms they extend, and each term ends in an empty named
+    group, so m.lastgroup tells which one matched.
+    """
+    trie: dict[str, dict] = {}
+    for group, term in term_groups.items():
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = group  # "" marks the end of a term
+    
+    def build(node: dict, depth: int) -> str:
+        if depth == _MAX_TRIE_DEPTH:
+            # re parses nested groups recursively, so deeper subtrees become
+            # a flat longest-first alternation of their remaining suffixes
+            branches = [
+                re.escape(suffix) + f"(?P<{group}>)\\b"
+                for suffix, group in sorted(_trie_suffixes(node), key=lambda item: -len(item[0]))
+            ]
+        else:
+            branches = [
+                re.escape(char) + build(child, depth + 1)
+                for char, child in node.items() if char
+            ]
+            if "" in node:
+                branches.append(f"(?P<{node['']}>)\\b")
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    
+    return build(trie, 0)
+
+
+def _trie_suffixes(node: dict) -> list[tuple[str, str]]:
+    """Return (suffix, group) for every term ending below a trie node."""
+    suffixes = []
+    stack = [("", node)]
+    while stack:
+        prefix, node = stack.pop()
+        for char, child in node.items():
+            if char:
+                stack.append((prefix + char, child))
+            else:
+                suffixes.append((prefix, child))
+    return suffixes
+
+
+class _CompiledRules(NamedTuple):
+    """Compiled forbidden terms and patterns (see _compile_rules)."""
+    terms_ac: Any
+    term_groups: dict[str, str]
+    terms_re: re.Pattern | None
+    shadowed_terms: dict[str, re.Pattern]
+    patterns_re: tuple[tuple[str, re.Pattern], ...]
+
+
+@lru_cache(maxsize=32)
+def _compile_rules(terms: tuple[str, ...], patterns: tuple[str, ...]) -> _CompiledRules:
+    """
+    Compile lowercased forbidden terms and forbidden patterns.
+    
+    Every new rule set, process and worker pays for compiling, so it stays
+    near-linear in the total length of the terms (one automaton, or a trie
+    regex plus a sorted shadow scan). On top of that, the cache spares
+    pipelines creating a validator per document from recompiling the same
+    rules.
+    """
+    # With pyahocorasick, all terms are matched in one linear scan and
+    # boundaries are checked per match, so no term can hide another; only
+    # the empty term, which the automaton cannot hold, is searched on its own
+    terms_ac = None
+    term_groups: dict[str, str] = {}
+    terms_re = None
+    if ahocorasick is not None and any(terms):
+        terms_ac = ahocorasick.Automaton()
+        for term in terms:
+            if term:
+                terms_ac.add_word(term, term)
+        terms_ac.make_automaton()
+        shadowed = {""} & set(terms)
+    else:
+        # Otherwise a case-insensitive lookahead over a trie of the terms
+        # finds overlapping terms too; the named group tells which matched
+        term_groups = {f"t{i}": term for i, term in enumerate(terms)}
+        if terms:
+            terms_re = re.compile(r"(?=\b" + _trie_pattern(term_groups) + ")", re.IGNORECASE)
+        # A term that is a prefix of a longer term can be hidden by it when
+        # both match at the same position, so those are checked on their own
+        shadowed = _find_shadowed(terms)
+    shadowed_terms = {
+        term: re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE) for term in shadowed
+    }
+    
+    patterns_re = tuple(
+        (pattern, re.compile(pattern, re.IGNORECASE)) for pattern in patterns
+    )
+    return _CompiledRules(terms_ac, term_groups, terms_re, shadowed_terms, patterns_re)
 
 
 class LexiconValidator:
@@ -50,6 +198,17 @@ class LexiconValidator:
         self.forbidden_verbs = lexicon.get("forbidden_verbs", [])
         self.forbidden_patterns = lexicon.get("forbidden_patterns", [])
         self.forbidden_terms = lexicon.get("forbidden_terms", [])
+        
+        # Compiled rules are shared between validators with the same config
+        rules = _compile_rules(
+            tuple(sorted({term.lower() for term in self.forbidden_verbs + self.forbidden_terms})),
+            tuple(self.forbidden_patterns),
+        )
+        self._terms_ac = rules.terms_ac
+        self._term_groups = rules.term_groups
+        self._terms_re = rules.terms_re
+        self._shadowed_terms = rules.shadowed_terms
+        self._patterns_re = rules.patterns_re
     
     def validate(self, text: str) -> ValidationResult:
         """
@@ -85,24 +244,49 @@ class LexiconValidator:
     def _check_forbidden_terms(self, text: str) -> list[str]:
         """Check for forbidden terms in text."""
         errors = []
-        text_lower = text.lower()
+        if self._terms_ac is None and self._terms_re is None:
+            return errors
         
-        all_forbidden = self.forbidden_verbs + self.forbidden_terms
+        found = self._find_terms(text)
         
-        for term in all_forbidden:
-            # Word boundary match
-            pattern = rf"\b{re.escape(term.lower())}\b"
-            if re.search(pattern, text_lower):
+        for term in self.forbidden_verbs + self.forbidden_terms:
+            if term.lower() in found:
                 errors.append(f"Forbidden term found: '{term}'")
         
         return errors
     
+    def _find_terms(self, text: str) -> set[str]:
+        """Return the (lowercased) forbidden terms found as whole words."""
+        if self._terms_ac is None:
+            found = {self._term_groups[m.lastgroup] for m in self._terms_re.finditer(text)}
+            for term, pattern in self._shadowed_terms.items():
+                if term not in found and pattern.search(text):
+                    found.add(term)
+            return found
+        
+        # The automaton holds lowercased terms, so it needs lowercased text
+        text_lower = text.lower()
+        found = set()
+        for end, term in self._terms_ac.iter(text_lower):
+            start = end - len(term) + 1
+            if (
+                term not in found
+                and _is_boundary(text_lower, start)
+                and _is_boundary(text_lower, end + 1)
+            ):
+                found.add(term)
+        # Empty terms are not stored in the automaton
+        for term, pattern in self._shadowed_terms.items():
+            if pattern.search(text_lower):
+                found.add(term)
+        return found
+    
     def _check_forbidden_patterns(self, text: str) -> list[str]:
         """Check for forbidden regex patterns in text."""
         errors = []
         
-        for pattern in self.forbidden_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern, compiled in self._patterns_re:
+            if compiled.search(text):
                 errors.append(f"Forbidden pattern found: '{pattern}'")
         
         return errors
@@ -111,22 +295,16 @@ class LexiconValidator:
         """Check for sentences exceeding word limit."""
         warnings = []
         
-        # Split into sentences
-        sentences = re.split(r"[.!?]+", text)
-        
         long_count = 0
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-            
-            words = sentence.split()
-            if len(words) > self.max_sentence_words:
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group()
+            word_count = len(sentence.split())
+            if word_count > self.max_sentence_words:
                 long_count += 1
                 if long_count <= 3:  # Only report first 3
                     warnings.append(
-                        f"Sentence too long ({len(words)} words, max {self.max_sentence_words}): "
-                        f"{sentence[:60]}..."
+                        f"Sentence too long ({word_count} words, max {self.max_sentence_words}): "
+                        f"{sentence.strip()[:60]}..."
                     )
         
         if long_count > 3:
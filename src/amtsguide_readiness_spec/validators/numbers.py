@@ -6,15 +6,31 @@ content can be traced back to the source work product.
 """
 
 import re
-from dataclasses import dataclass, field
+from typing import Any, Iterator
 
+from .result import ValidationResult
 
-@dataclass
-class ValidationResult:
-    """Result of validation check."""
-    passed: bool
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
+
+_NUMBER_RE = re.compile(r"\d+")
+
+# Years ignored when ignore_years is set (as they appear in text: 1900-2100)
+_YEARS = frozenset(str(year) for year in range(1900, 2101))
+
+# Group 1: number opening a line, followed by ".", ")" or whitespace;
+# group 2: any other number
+_TEXT_NUMBER_RE = re.compile(r"^[^\S\n]*(\d+)(?=[.)]|[^\S\n])|(\d+)", re.MULTILINE)
+
+
+def _iter_leaf_strings(value: Any) -> Iterator[str]:
+    """Yield str() of every non-None leaf in nested dicts and lists."""
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_leaf_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_leaf_strings(item)
+    elif value is not None:
+        yield str(value)
 
 
 class NumbersAgainstSourceValidator:
@@ -75,7 +91,7 @@ class NumbersAgainstSourceValidator:
         
         # Filter out years if configured
         if self.ignore_years:
-            unexpected = {n for n in unexpected if not self._is_year(n)}
+            unexpected -= _YEARS
         
         if unexpected:
             errors.append(
@@ -91,45 +107,27 @@ class NumbersAgainstSourceValidator:
     
     def _extract_numbers(self, text: str) -> set[str]:
         """Extract all numbers from text."""
-        # Find all number sequences
-        numbers = set(re.findall(r"\d+", text))
-        
-        # Optionally filter section numbers (numbers at start of line followed by . or ))
-        if self.ignore_section_numbers:
-            # This is a simple heuristic - could be improved
-            lines = text.split("\n")
-            section_nums = set()
-            for line in lines:
-                match = re.match(r"^\s*(\d+)[.)\s]", line)
-                if match:
-                    section_nums.add(match.group(1))
-            numbers -= section_nums
-        
-        return numbers
-    
-    def _extract_source_numbers(self, work_product: dict) -> set[str]:
-        """Extract all numbers from work product values."""
         numbers = set()
+        section_nums = set()
         
-        for key, value in work_product.items():
-            if key.startswith("_"):
-                continue
-            
-            if value is None:
-                continue
-            
-            # Extract numbers from value
-            value_str = str(value)
-            found = re.findall(r"\d+", value_str)
-            numbers.update(found)
+        # Section numbers (numbers at start of line followed by . or ))
+        # are told apart in the same pass - a simple heuristic
+        for section_num, number in _TEXT_NUMBER_RE.findall(text):
+            if section_num:
+                section_nums.add(section_num)
+            else:
+                numbers.add(number)
         
-        return numbers
+        if self.ignore_section_numbers:
+            return numbers - section_nums
+        return numbers | section_nums
     
-    def _is_year(self, num_str: str) -> bool:
-        """Check if number looks like a year."""
-        try:
-            num = int(num_str)
-            return 1900 <= num <= 2100
-        except ValueError:
-            return False
-
+    def _extract_source_numbers(self, work_product: dict) -> set[str]:
+        """Extract all numbers from work product values, including nested ones."""
+        values = "\x00".join(
+            text
+            for key, value in work_product.items()
+            if not key.startswith("_")
+            for text in _iter_leaf_strings(value)
+        )
+        return set(_NUMBER_RE.findall(values))
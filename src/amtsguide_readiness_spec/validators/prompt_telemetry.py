@@ -9,7 +9,25 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+_HASH_DIGITS = '0123456789abcdef'
+
+# Used with fullmatch, so a trailing newline is not accepted
+_VERSION_RE = re.compile(r'[a-z]+-[a-z]+-v[0-9]+\.[0-9]+')
+
+_TELEMETRY_REQUIRED_FIELDS = ('document_id', 'prompt_type', 'prompt_version', 'prompt_hash')
+_ATTEMPT_REQUIRED_FIELDS = ('session_id', 'prompt_type', 'prompt_version', 'prompt_hash',
+                           'attempt_number', 'outcome', 'generated_at')
+_SCORE_FIELDS = ('validator_score', 'pipeline_efficiency', 'post_gen_edit_score', 'composite_score')
+
+_PROMPT_TYPES = ('cluster', 'bezirk', 'overview', 'supplier', 'blog')
+_OUTCOMES = ('accepted', 'rejected')
+
+# Sets for membership tests; the tuples above keep the order for messages
+_VALID_PROMPT_TYPES = frozenset(_PROMPT_TYPES)
+_VALID_OUTCOMES = frozenset(_OUTCOMES)
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation."""
     valid: bool
@@ -22,9 +40,10 @@ class ValidationResult:
 
 def validate_prompt_hash(hash_value: str) -> bool:
     """Validate prompt hash format (12 hex chars)."""
-    if not hash_value:
+    if not isinstance(hash_value, str) or len(hash_value) != 12:
         return False
-    return bool(re.match(r'^[a-f0-9]{12}$', hash_value))
+    # Stripping every hex digit leaves nothing only if all 12 chars are hex
+    return not hash_value.strip(_HASH_DIGITS)
 
 
 def validate_prompt_version(version: str) -> bool:
@@ -34,9 +53,9 @@ def validate_prompt_version(version: str) -> bool:
     Expected format: {type}-{city}-v{major}.{minor}
     Examples: cluster-berlin-v1.0, bezirk-munich-v2.1
     """
-    if not version:
+    if not version or not isinstance(version, str):
         return False
-    return bool(re.match(r'^[a-z]+-[a-z]+-v[0-9]+\.[0-9]+$', version))
+    return _VERSION_RE.fullmatch(version) is not None
 
 
 def validate_score(score: float, field_name: str) -> Optional[str]:
@@ -64,8 +83,7 @@ def validate_telemetry_record(record: dict) -> ValidationResult:
     warnings = []
     
     # Required fields
-    required_fields = ['document_id', 'prompt_type', 'prompt_version', 'prompt_hash']
-    for field in required_fields:
+    for field in _TELEMETRY_REQUIRED_FIELDS:
         if field not in record or not record[field]:
             errors.append(f"Missing required field: {field}")
     
@@ -80,14 +98,12 @@ def validate_telemetry_record(record: dict) -> ValidationResult:
         warnings.append(f"Non-standard prompt_version format: {prompt_version}")
     
     # Validate prompt_type enum
-    valid_types = ['cluster', 'bezirk', 'overview', 'supplier', 'blog']
     prompt_type = record.get('prompt_type', '')
-    if prompt_type and prompt_type not in valid_types:
-        errors.append(f"Invalid prompt_type: {prompt_type} (expected one of {valid_types})")
+    if prompt_type and (not isinstance(prompt_type, str) or prompt_type not in _VALID_PROMPT_TYPES):
+        errors.append(f"Invalid prompt_type: {prompt_type} (expected one of {list(_PROMPT_TYPES)})")
     
     # Validate scores
-    score_fields = ['validator_score', 'pipeline_efficiency', 'post_gen_edit_score', 'composite_score']
-    for field in score_fields:
+    for field in _SCORE_FIELDS:
         if field in record and record[field] is not None:
             error = validate_score(record[field], field)
             if error:
@@ -119,6 +135,19 @@ def validate_telemetry_record(record: dict) -> ValidationResult:
     )
 
 
+def validate_telemetry_records(records: List[dict]) -> List[ValidationResult]:
+    """
+    Validate a batch of prompt telemetry records (e.g. a telemetry dump).
+    
+    Args:
+        records: List of telemetry record dictionaries
+        
+    Returns:
+        One ValidationResult per record, in input order
+    """
+    return [validate_telemetry_record(record) for record in records]
+
+
 def validate_generation_attempt(attempt: dict) -> ValidationResult:
     """
     Validate a generation attempt record.
@@ -133,15 +162,13 @@ def validate_generation_attempt(attempt: dict) -> ValidationResult:
     warnings = []
     
     # Required fields
-    required_fields = ['session_id', 'prompt_type', 'prompt_version', 'prompt_hash', 
-                       'attempt_number', 'outcome', 'generated_at']
-    for field in required_fields:
+    for field in _ATTEMPT_REQUIRED_FIELDS:
         if field not in attempt or attempt[field] is None:
             errors.append(f"Missing required field: {field}")
     
     # Validate outcome enum
     outcome = attempt.get('outcome', '')
-    if outcome and outcome not in ['accepted', 'rejected']:
+    if outcome and (not isinstance(outcome, str) or outcome not in _VALID_OUTCOMES):
         errors.append(f"Invalid outcome: {outcome} (expected 'accepted' or 'rejected')")
     
     # Validate attempt_number
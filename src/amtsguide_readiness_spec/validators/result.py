@@ -0,0 +1,16 @@
+"""
+ValidationResult
+
+Shared result type for WorkProductValidator, LexiconValidator and
+NumbersAgainstSourceValidator.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Result of validation check."""
+    passed: bool
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
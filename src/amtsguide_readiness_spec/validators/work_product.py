@@ -7,17 +7,48 @@ Validates that AI work products have required provenance:
 - *_source for fact fields (per policy)
 """
 
-from dataclasses import dataclass, field
-from typing import Any
-import re
+import sys
+from functools import lru_cache
+from typing import Any, Callable
 
+from .result import ValidationResult
 
-@dataclass
-class ValidationResult:
-    """Result of validation check."""
-    passed: bool
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
+
+_REQUIRED_METADATA_FIELDS = ("extraction_date", "model", "extractor_version")
+_PROVENANCE_SUFFIXES = ("_source", "_verified_at")
+
+
+@lru_cache(maxsize=1024)
+def _classify_keys(
+    keys: tuple[str, ...], identity_fields: frozenset, non_fact_fields: frozenset
+) -> tuple[str, ...]:
+    """
+    Return the fact fields among keys.
+    
+    A field is a fact field if:
+    - Does NOT start with _
+    - Does NOT end with _source or _verified_at
+    - Is NOT in identity_fields
+    - Is NOT in non_fact_fields
+    """
+    return tuple(
+        key for key in keys
+        if not (
+            key.startswith("_")
+            or key.endswith(_PROVENANCE_SUFFIXES)
+            or key in identity_fields
+            or key in non_fact_fields
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
+def _provenance_keys(fact_fields: tuple[str, ...]) -> tuple[tuple[str, str, str], ...]:
+    """Pair each fact field with its *_verified_at and *_source keys."""
+    return tuple(
+        (field_name, field_name + "_verified_at", field_name + "_source")
+        for field_name in fact_fields
+    )
 
 
 class WorkProductValidator:
@@ -39,12 +70,18 @@ class WorkProductValidator:
         """
         self.config = config or {}
         self.field_policy = self.config.get("field_policy", {})
-        self.identity_fields = set(self.field_policy.get("identity_fields", []))
-        self.non_fact_fields = set(self.field_policy.get("non_fact_fields", ["notes"]))
+        # Interned so lookups of interned keys hit on identity
+        self.identity_fields = frozenset(map(sys.intern, self.field_policy.get("identity_fields", [])))
+        self.non_fact_fields = frozenset(map(sys.intern, self.field_policy.get("non_fact_fields", ["notes"])))
         self.require_source = self.field_policy.get("require_source", "numbers_only")
         self.source_exceptions = set(self.field_policy.get("source_exceptions", []))
         self.missing_source_severity = self.field_policy.get("missing_source_severity", "warning")
         self.missing_verified_at_severity = self.field_policy.get("missing_verified_at_severity", "error")
+        
+        # Severity routing is fixed per validator, not per field
+        self._missing_source_is_error = self.missing_source_severity == "error"
+        self._missing_verified_at_is_error = self.missing_verified_at_severity == "error"
+        self._requires_source_value = self._make_source_predicate()
     
     def validate(self, work_product: dict) -> ValidationResult:
         """
@@ -56,23 +93,28 @@ class WorkProductValidator:
         Returns:
             ValidationResult with passed, errors, warnings
         """
-        errors = []
-        warnings = []
+        # Without _metadata the work product is rejected outright; its
+        # fields are not checked
+        metadata = work_product.get("_metadata")
+        if metadata is None:
+            return ValidationResult(
+                passed=False,
+                errors=["Missing _metadata block"],
+                warnings=[]
+            )
         
-        # Check _metadata
-        meta_errors = self._check_metadata(work_product)
-        errors.extend(meta_errors)
+        errors = self._check_metadata(metadata)
+        warnings = []
         
         # Get all fact fields
         fact_fields = self._get_fact_fields(work_product)
         
-        # Check each fact field for provenance
-        for field_name in fact_fields:
-            field_errors, field_warnings = self._check_field_provenance(
-                work_product, field_name
+        # Check each fact field for provenance; the key names are built once
+        # per fact-field tuple, like the classification itself
+        for field_name, verified_at_key, source_key in _provenance_keys(fact_fields):
+            self._check_field_provenance(
+                work_product, field_name, verified_at_key, source_key, errors, warnings
             )
-            errors.extend(field_errors)
-            warnings.extend(field_warnings)
         
         return ValidationResult(
             passed=len(errors) == 0,
@@ -80,73 +122,46 @@ class WorkProductValidator:
             warnings=warnings
         )
     
-    def _check_metadata(self, work_product: dict) -> list[str]:
-        """Check _metadata block exists with required fields."""
+    def _check_metadata(self, metadata: dict) -> list[str]:
+        """Check the _metadata block has the required fields."""
         errors = []
-        
-        if "_metadata" not in work_product:
-            errors.append("Missing _metadata block")
-            return errors
-        
-        metadata = work_product["_metadata"]
-        required_fields = ["extraction_date", "model", "extractor_version"]
-        
-        for field in required_fields:
-            if field not in metadata:
-                errors.append(f"Missing metadata field: {field}")
-            elif not metadata[field]:
-                errors.append(f"Empty metadata field: {field}")
+        for field in _REQUIRED_METADATA_FIELDS:
+            # One lookup on the happy path; membership only decides the message
+            if not metadata.get(field):
+                if field in metadata:
+                    errors.append(f"Empty metadata field: {field}")
+                else:
+                    errors.append(f"Missing metadata field: {field}")
         
         return errors
     
-    def _get_fact_fields(self, work_product: dict) -> list[str]:
+    def _get_fact_fields(self, work_product: dict) -> tuple[str, ...]:
         """
-        Get list of fact fields from work product.
+        Get fact fields from work product, in key order.
         
-        A field is a fact field if:
-        - Does NOT start with _
-        - Does NOT end with _source or _verified_at
-        - Is NOT in identity_fields
-        - Is NOT in non_fact_fields
+        See _classify_keys for the rules. Results are cached per key set, so
+        streams of same-shaped work products classify their keys once.
         """
-        fact_fields = []
-        
-        for key in work_product.keys():
-            # Skip metadata
-            if key.startswith("_"):
-                continue
-            
-            # Skip provenance fields
-            if key.endswith("_source") or key.endswith("_verified_at"):
-                continue
-            
-            # Skip identity fields
-            if key in self.identity_fields:
-                continue
-            
-            # Skip non-fact fields
-            if key in self.non_fact_fields:
-                continue
-            
-            fact_fields.append(key)
-        
-        return fact_fields
+        return _classify_keys(
+            tuple(work_product), self.identity_fields, self.non_fact_fields
+        )
     
     def _check_field_provenance(
-        self, work_product: dict, field_name: str
-    ) -> tuple[list[str], list[str]]:
-        """Check a single field has required provenance."""
-        errors = []
-        warnings = []
-        
+        self,
+        work_product: dict,
+        field_name: str,
+        verified_at_key: str,
+        source_key: str,
+        errors: list[str],
+        warnings: list[str],
+    ) -> None:
+        """Check a single field has required provenance, appending to errors/warnings."""
         value = work_product.get(field_name)
-        verified_at_key = f"{field_name}_verified_at"
-        source_key = f"{field_name}_source"
         
         # Check verified_at exists
         if verified_at_key not in work_product:
             msg = f"Field '{field_name}' missing verification date ({verified_at_key})"
-            if self.missing_verified_at_severity == "error":
+            if self._missing_verified_at_is_error:
                 errors.append(msg)
             else:
                 warnings.append(msg)
@@ -162,7 +177,7 @@ class WorkProductValidator:
         # Check source exists (key must exist, value per policy)
         if source_key not in work_product:
             msg = f"Field '{field_name}' missing source key ({source_key})"
-            if self.missing_source_severity == "error":
+            if self._missing_source_is_error:
                 errors.append(msg)
             else:
                 warnings.append(msg)
@@ -172,33 +187,43 @@ class WorkProductValidator:
             if self._requires_source_value(field_name, value):
                 if not source_value:
                     msg = f"Field '{field_name}' requires non-empty source"
-                    if self.missing_source_severity == "error":
+                    if self._missing_source_is_error:
                         errors.append(msg)
                     else:
                         warnings.append(msg)
-        
-        return errors, warnings
     
-    def _requires_source_value(self, field_name: str, value: Any) -> bool:
-        """Check if field requires a non-empty source value."""
-        # Check exceptions
-        if field_name in self.source_exceptions:
-            return False
-        
-        # Check policy
-        if self.require_source == "none":
-            return False
-        elif self.require_source == "all":
-            return True
-        elif self.require_source == "numbers_only":
-            # Require source for numeric values
-            return isinstance(value, (int, float)) and value is not None
+    def _make_source_predicate(self) -> Callable[[str, Any], bool]:
+        """
+        Build the check for whether a field requires a non-empty source value.
         
-        return False
+        The source policy is fixed per validator, so it is resolved once here
+        instead of on every field.
+        """
+        exceptions = self.source_exceptions
+        
+        if self.require_source == "all":
+            return lambda field_name, value: field_name not in exceptions
+        if self.require_source == "numbers_only":
+            # Require source for numeric values; bool is an int subclass
+            # but a flag, not a number
+            return lambda field_name, value: (
+                field_name not in exceptions
+                and isinstance(value, (int, float))
+                and not isinstance(value, bool)
+            )
+        # "none" and unknown policies never require a source value
+        return lambda field_name, value: False
     
     def _is_valid_date(self, date_str: str) -> bool:
         """Check if string is valid ISO date (YYYY-MM-DD)."""
-        if not isinstance(date_str, str):
-            return False
-        return bool(re.match(r"^\d{4}-\d{2}-\d{2}$", date_str))
+        # Fixed-width format: cheaper to check positions than to run a regex
+        return (
+            isinstance(date_str, str)
+            and len(date_str) == 10
+            and date_str[4] == "-"
+            and date_str[7] == "-"
+            and date_str[:4].isdecimal()
+            and date_str[5:7].isdecimal()
+            and date_str[8:].isdecimal()
+        )
 
@@ -1,64 +1,80 @@
 """Pytest configuration and fixtures."""
 
-import json
 from pathlib import Path
 
 import pytest
 import yaml
 
+from amtsguide_readiness_spec.validators.work_product import WorkProductValidator
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
 CONFIG_DIR = Path(__file__).parent.parent / "config"
 SCHEMAS_DIR = Path(__file__).parent.parent / "schemas"
 
 
-@pytest.fixture
+# Fixtures are loaded once per session; tests must not mutate them
+# (deepcopy first if a test needs a modified copy).
+
+@pytest.fixture(scope="session")
 def sample_config():
     """Load sample configuration."""
     config_path = CONFIG_DIR / "sample.yaml"
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return yaml.load(config_path.read_bytes(), Loader=SafeLoader)
+
+
+@pytest.fixture(scope="module")
+def default_validator(sample_config):
+    """WorkProductValidator built from the sample configuration."""
+    return WorkProductValidator(sample_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_work_product():
     """Load valid work product example."""
     path = EXAMPLES_DIR / "work_product.valid.json"
-    with open(path) as f:
-        return json.load(f)
+    return json_loads(path.read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def work_product_missing_verified_at():
     """Load work product missing verified_at."""
     path = EXAMPLES_DIR / "work_product.missing_verified_at.json"
-    with open(path) as f:
-        return json.load(f)
+    return json_loads(path.read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def work_product_missing_metadata():
     """Load work product missing metadata."""
     path = EXAMPLES_DIR / "work_product.missing_metadata.json"
-    with open(path) as f:
-        return json.load(f)
+    return json_loads(path.read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_text():
     """Load valid text example."""
     path = EXAMPLES_DIR / "text.valid.md"
     return path.read_text()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def text_with_forbidden_term():
     """Load text with forbidden terms."""
     path = EXAMPLES_DIR / "text.forbidden_term.md"
     return path.read_text()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def text_with_hallucinated_number():
     """Load text with hallucinated numbers."""
     path = EXAMPLES_DIR / "text.hallucinated_number.md"
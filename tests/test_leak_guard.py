@@ -0,0 +1,185 @@
+"""Tests for scripts/leak_guard.py."""
+
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import leak_guard
+
+
+# Fixture content -> expected scan_file() result, shared by every scan path
+CASES = {
+    "code_fences": (
+        "Contact: max@firma.de\n"
+        "```\n"
+        "x@firma.de\n"
+        "```\n"
+        "Call +49 30 1234\n"
+        "  ```yaml\n"
+        "phone: 030 1234567\n",
+        [
+            (1, "Real email address", "Contact: max@firma.de"),
+            (5, "German phone number (+49)", "Call +49 30 1234"),
+        ],
+    ),
+    "bad_example": (
+        "Intro\n"
+        "DO NOT write it like this:\n"
+        "mail: max@firma.de\n"
+        "**OK:** write anna@firma.de instead\n"
+        "Tel 030 1234567\n"
+        "Bad: portal.gov\n"
+        "(030) 1234\n"
+        "**Synthetic**\n",
+        [
+            (4, "Real email address", "**OK:** write anna@firma.de instead"),
+            (5, "Berlin phone number (030)", "Tel 030 1234567"),
+        ],
+    ),
+    "example_emails": (
+        "ops@example.com\n"
+        "ops@example.org\n"
+        "ops@example.invalid\n"
+        "ops@firma.de\n",
+        [
+            (4, "Real email address", "ops@firma.de"),
+        ],
+    ),
+    "gov_paths": (
+        "https://portal.gov/forms\n"
+        "see portal.gov for details\n"
+        "agency.gov\n",
+        [
+            (2, "Real government domain", "see portal.gov for details"),
+            (3, "Real government domain", "agency.gov"),
+        ],
+    ),
+    "crlf": (
+        "line one\r\n"
+        "line two\r\n"
+        "mail: max@firma.de\r\n"
+        "\r\n"
+        "service.berlin.de\r\n",
+        [
+            (3, "Real email address", "mail: max@firma.de"),
+            (5, "Real Berlin domain", "service.berlin.de"),
+        ],
+    ),
+    "non_ascii": (
+        "Grüße aus Köln\n"
+        "Kontakt: jürgen@firma.de\n"
+        "Tel +49\u00a01234\n",  # \s matches the no-break space only in str
+        [
+            (2, "Real email address", "Kontakt: jürgen@firma.de"),
+            (3, "German phone number (+49)", "Tel +49\u00a01234"),
+        ],
+    ),
+}
+
+
+@pytest.fixture(params=["default", "mmap", "no_hyperscan", "mmap_no_hyperscan"])
+def scan_mode(request, monkeypatch):
+    """Force scan_file down each content path (mmap, regex-only locator)."""
+    if "mmap" in request.param:
+        monkeypatch.setattr(leak_guard, "MMAP_MIN_SIZE", 0)
+    if "no_hyperscan" in request.param:
+        monkeypatch.setattr(leak_guard, "HYPERSCAN_DB", None)
+    return request.param
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_scan_file(tmp_path, scan_mode, case):
+    """Every content path reports the same issues."""
+    content, expected = CASES[case]
+    path = tmp_path / f"{case}.md"
+    path.write_bytes(content.encode())
+    
+    assert leak_guard.scan_file(path) == expected
+
+
+def test_read_content_picks_path(tmp_path, monkeypatch):
+    """ASCII is read as bytes, non-ASCII as str, large files are mapped."""
+    ascii_path = tmp_path / "ascii.md"
+    ascii_path.write_bytes(CASES["crlf"][0].encode())
+    utf8_path = tmp_path / "utf8.md"
+    utf8_path.write_bytes(CASES["non_ascii"][0].encode())
+    
+    assert isinstance(leak_guard.read_content(ascii_path), bytes)
+    assert isinstance(leak_guard.read_content(utf8_path), str)
+    
+    monkeypatch.setattr(leak_guard, "MMAP_MIN_SIZE", 0)
+    mapped = leak_guard.read_content(ascii_path)
+    try:
+        assert isinstance(mapped, mmap.mmap)
+    finally:
+        mapped.close()
+    assert isinstance(leak_guard.read_content(utf8_path), str)
+
+
+def test_example_email_domains_are_not_leaks():
+    """Reserved example domains are filtered from email matches."""
+    email_re = next(
+        pattern for pattern, description in leak_guard.LEAK_PATTERNS_COMPILED
+        if description == "Real email address"
+    )
+    
+    for domain in ("example.com", "example.org", "example.invalid", "EXAMPLE.COM"):
+        assert leak_guard.pattern_matches(email_re, f"ops@{domain}") is False
+    assert leak_guard.pattern_matches(email_re, "ops@example.com, ops@firma.de") is True
+
+
+class _RecordingExecutor(ProcessPoolExecutor):
+    """ProcessPoolExecutor that records that it was used."""
+    
+    instances = 0
+    
+    def __init__(self, *args, **kwargs):
+        type(self).instances += 1
+        super().__init__(*args, **kwargs)
+
+
+def test_scan_files_in_parallel(tmp_path, monkeypatch):
+    """The process pool returns the same results, in input order."""
+    paths = []
+    for case, (content, _) in CASES.items():
+        path = tmp_path / f"{case}.md"
+        path.write_bytes(content.encode())
+        paths.append(path)
+    
+    monkeypatch.setattr(leak_guard, "PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(leak_guard, "ProcessPoolExecutor", _RecordingExecutor)
+    monkeypatch.setattr(_RecordingExecutor, "instances", 0)
+    
+    assert leak_guard.scan_files(paths) == [expected for _, expected in CASES.values()]
+    assert _RecordingExecutor.instances == 1
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "See BLOCKED list\rcontact: max@firma.de\r",
+        "See BLOCKED list\x0ccontact: max@firma.de\n",
+        "See BLOCKED list\x85contact: max@firma.de\n",
+        "See BLOCKED list contact: max@firma.de\n",
+        "See BLOCKED list\x1econtact: max@firma.de\n",
+    ],
+)
+def test_skip_marker_does_not_hide_next_line(tmp_path, scan_mode, content):
+    """Every str.splitlines() break ends a line, not just \\n."""
+    path = tmp_path / "doc.md"
+    path.write_bytes(content.encode())
+    
+    assert leak_guard.scan_file(path) == [
+        (2, "Real email address", "contact: max@firma.de"),
+    ]
+
+
+def test_line_numbers_after_other_line_breaks(tmp_path, scan_mode):
+    """Line numbers count every splitlines() break, with \\r\\n counting once."""
+    path = tmp_path / "doc.md"
+    path.write_bytes(b"one\r\ntwo\rthree\x0bfour\nmail: max@firma.de\r\n")
+    
+    assert leak_guard.scan_file(path) == [
+        (5, "Real email address", "mail: max@firma.de"),
+    ]
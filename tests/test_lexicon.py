@@ -1,10 +1,21 @@
 """Tests for LexiconValidator."""
 
+import time
+
 import pytest
 
+from amtsguide_readiness_spec.validators import lexicon
 from amtsguide_readiness_spec.validators.lexicon import LexiconValidator
 
 
+@pytest.fixture
+def fresh_rule_cache():
+    """Empty the compiled-rules cache before and after a backend-patching test."""
+    lexicon._compile_rules.cache_clear()
+    yield
+    lexicon._compile_rules.cache_clear()
+
+
 class TestLexiconValidator:
     """Test suite for LexiconValidator."""
 
@@ -130,3 +141,95 @@ class TestLexiconValidator:
         assert result.passed is False
         assert len(result.errors) >= 3
 
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_overlapping_terms_all_reported(self, monkeypatch, fresh_rule_cache, use_automaton):
+        """Terms that overlap or prefix each other should all be reported."""
+        if use_automaton:
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr(lexicon, "ahocorasick", None)
+        
+        config = {
+            "lexicon_rules": {
+                "forbidden_terms": ["new", "new york", "york city", "newer"]
+            }
+        }
+        
+        text = "Offices in New York City are open."
+        
+        validator = LexiconValidator(config)
+        result = validator.validate(text)
+        
+        assert result.errors == [
+            "Forbidden term found: 'new'",
+            "Forbidden term found: 'new york'",
+            "Forbidden term found: 'york city'",
+        ]
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_prefix_shadowed_by_later_term(self, monkeypatch, fresh_rule_cache, use_automaton):
+        """A prefix is reported even if the term hiding it is not its neighbour in sort order."""
+        if use_automaton:
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr(lexicon, "ahocorasick", None)
+        
+        config = {
+            "lexicon_rules": {
+                # Sorted: "ab", "ab1", "ab~"; only "ab~" leaves a boundary after "ab"
+                "forbidden_terms": ["ab", "ab1", "ab~"]
+            }
+        }
+        
+        validator = LexiconValidator(config)
+        result = validator.validate("See ab~c here.")
+        
+        assert result.errors == [
+            "Forbidden term found: 'ab'",
+            "Forbidden term found: 'ab~'",
+        ]
+
+    def test_deeply_nested_prefix_terms(self, monkeypatch, fresh_rule_cache):
+        """Long chains of prefix terms compile and report the longest whole word."""
+        monkeypatch.setattr(lexicon, "ahocorasick", None)
+        
+        config = {
+            "lexicon_rules": {
+                "forbidden_terms": ["a" * length for length in range(1, 200)]
+            }
+        }
+        
+        validator = LexiconValidator(config)
+        result = validator.validate("See " + "a" * 150 + " here.")
+        
+        assert result.errors == [f"Forbidden term found: '{'a' * 150}'"]
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_large_glossary_compiles_quickly(self, monkeypatch, fresh_rule_cache, use_automaton):
+        """Thousands of terms compile and validate without per-pair or per-term passes."""
+        if use_automaton:
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr(lexicon, "ahocorasick", None)
+        
+        # Every tenth term is a prefix of a phrase, so some terms are shadowed
+        terms = [f"term{i}" for i in range(10000)]
+        terms += [f"term{i} extra" for i in range(0, 10000, 10)]
+        config = {"lexicon_rules": {"forbidden_terms": terms}}
+        
+        start = time.perf_counter()
+        validator = LexiconValidator(config)
+        result = validator.validate("See term20 extra and term7. " * 200)
+        elapsed = time.perf_counter() - start
+        
+        assert result.errors == [
+            "Forbidden term found: 'term7'",
+            "Forbidden term found: 'term20'",
+            "Forbidden term found: 'term20 extra'",
+        ]
+        # The automaton needs no regex over the terms and no shadowed-term searches
+        if use_automaton:
+            assert validator._terms_re is None
+            assert validator._shadowed_terms == {}
+        # Pairwise shadow checks or a flat alternation take tens of seconds here
+        assert elapsed < 5
@@ -118,6 +118,20 @@ The fee is 25 EUR.
         
         assert result.passed is True
 
+    def test_numbers_extracted_from_nested_values(self):
+        """Numbers in nested dicts and lists should be extracted."""
+        work_product = {
+            "_metadata": {"extraction_date": "2025-01-15T10:00:00Z", "model": "test", "extractor_version": "1.0"},
+            "fees": {"standard": 25, "reduced": [10, "12.50 EUR"]}
+        }
+        
+        content = "The fee is 25 EUR, reduced 10 EUR or 12.50 EUR."
+        
+        validator = NumbersAgainstSourceValidator()
+        result = validator.validate(content, work_product)
+        
+        assert result.passed is True
+
     def test_empty_content_passes(self):
         """Empty content should pass."""
         work_product = {
@@ -10,6 +10,7 @@ from amtsguide_readiness_spec.validators.prompt_telemetry import (
     validate_prompt_hash,
     validate_prompt_version,
     validate_telemetry_record,
+    validate_telemetry_records,
     validate_generation_attempt,
 )
 
@@ -30,6 +31,9 @@ def test_invalid_prompt_hash():
     assert validate_prompt_hash("ae7cca7353ff1234") is False  # Too long
     assert validate_prompt_hash("ae7cca7353fX") is False  # Invalid char
     assert validate_prompt_hash("AE7CCA7353FF") is False  # Uppercase
+    assert validate_prompt_hash("ae7cca7353ff\n") is False  # Trailing newline
+    assert validate_prompt_hash("0xae7cca7353") is False  # Hex prefix
+    assert validate_prompt_hash("ae7c_ca7353f") is False  # Digit separator
 
 
 # === Version Validation Tests ===
@@ -48,6 +52,7 @@ def test_invalid_prompt_version():
     assert validate_prompt_version("cluster-v1.0") is False  # Missing city
     assert validate_prompt_version("cluster-berlin-1.0") is False  # Missing 'v'
     assert validate_prompt_version("CLUSTER-BERLIN-v1.0") is False  # Uppercase
+    assert validate_prompt_version("cluster-berlin-v1.0\n") is False  # Trailing newline
 
 
 # === Telemetry Record Validation Tests ===
@@ -67,6 +72,20 @@ def test_valid_telemetry_record():
     assert len(result.errors) == 0
 
 
+def test_non_string_hash_and_version():
+    """Non-string prompt_hash/prompt_version should fail validation, not raise."""
+    record = {
+        "document_id": "test-doc",
+        "prompt_type": "bezirk",
+        "prompt_version": 10,
+        "prompt_hash": 123456789012,
+    }
+    result = validate_telemetry_record(record)
+    assert result.valid is False
+    assert any("prompt_hash" in e for e in result.errors)
+    assert any("prompt_version" in w for w in result.warnings)
+
+
 def test_missing_required_fields():
     """Missing required fields should fail."""
     record = {
@@ -119,6 +138,22 @@ def test_invalid_attempts():
     assert any("attempts_to_acceptance" in e for e in result.errors)
 
 
+def test_batch_telemetry_records():
+    """Batch validation should return one result per record, in order."""
+    valid = {
+        "document_id": "test-doc",
+        "prompt_type": "bezirk",
+        "prompt_version": "bezirk-berlin-v1.0",
+        "prompt_hash": "ae7cca7353ff",
+        "validator_score": 87.5,
+        "attempts_to_acceptance": 1,
+    }
+    invalid = {**valid, "composite_score": -5}
+    results = validate_telemetry_records([valid, invalid, valid])
+    assert [r.valid for r in results] == [True, False, True]
+    assert any("composite_score" in e for e in results[1].errors)
+
+
 # === Generation Attempt Validation Tests ===
 
 def test_valid_generation_attempt():
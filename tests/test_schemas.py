@@ -1,10 +1,14 @@
 """Tests for JSON schemas."""
 
-import json
 from pathlib import Path
 
 import pytest
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 try:
     import jsonschema
     HAS_JSONSCHEMA = True
@@ -19,15 +23,25 @@ EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
 def load_schema(name: str) -> dict:
     """Load a JSON schema by name."""
     path = SCHEMAS_DIR / name
-    with open(path) as f:
-        return json.load(f)
+    return json_loads(path.read_bytes())
 
 
 def load_example(name: str) -> dict:
     """Load a JSON example by name."""
     path = EXAMPLES_DIR / name
-    with open(path) as f:
-        return json.load(f)
+    return json_loads(path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def schema_validators():
+    """Build one validator per schema, using the draft the schema declares."""
+    validators = {}
+    for name in ("work_product.schema.json", "change_log.schema.json", "readiness_card.schema.json"):
+        schema = load_schema(name)
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validators[name] = validator_class(schema)
+    return validators
 
 
 @pytest.mark.skipif(not HAS_JSONSCHEMA, reason="jsonschema not installed")
@@ -60,37 +74,33 @@ class TestSchemas:
         assert "stop_rules" in schema["required"]
         assert "non_claims" in schema["required"]
 
-    def test_valid_work_product_validates(self):
+    def test_valid_work_product_validates(self, schema_validators):
         """Valid work product should validate against schema."""
-        schema = load_schema("work_product.schema.json")
         example = load_example("work_product.valid.json")
         
         # Should not raise
-        jsonschema.validate(example, schema)
+        schema_validators["work_product.schema.json"].validate(example)
 
-    def test_valid_change_log_validates(self):
+    def test_valid_change_log_validates(self, schema_validators):
         """Valid change log should validate against schema."""
-        schema = load_schema("change_log.schema.json")
         example = load_example("change_log.valid.json")
         
         # Should not raise
-        jsonschema.validate(example, schema)
+        schema_validators["change_log.schema.json"].validate(example)
 
-    def test_valid_readiness_card_validates(self):
+    def test_valid_readiness_card_validates(self, schema_validators):
         """Valid readiness card should validate against schema."""
-        schema = load_schema("readiness_card.schema.json")
         example = load_example("readiness_card.valid.json")
         
         # Should not raise
-        jsonschema.validate(example, schema)
+        schema_validators["readiness_card.schema.json"].validate(example)
 
-    def test_missing_metadata_fails_schema(self):
+    def test_missing_metadata_fails_schema(self, schema_validators):
         """Work product without _metadata should fail schema validation."""
-        schema = load_schema("work_product.schema.json")
         example = load_example("work_product.missing_metadata.json")
         
         with pytest.raises(jsonschema.ValidationError):
-            jsonschema.validate(example, schema)
+            schema_validators["work_product.schema.json"].validate(example)
 
     def test_all_schemas_exist(self):
         """All expected schema files should exist."""
@@ -107,7 +117,6 @@ class TestSchemas:
     def test_all_schemas_are_valid_json(self):
         """All schema files should be valid JSON."""
         for schema_path in SCHEMAS_DIR.glob("*.json"):
-            with open(schema_path) as f:
-                data = json.load(f)  # Should not raise
-                assert isinstance(data, dict)
+            data = json_loads(schema_path.read_bytes())  # Should not raise
+            assert isinstance(data, dict)
 
@@ -5,149 +5,219 @@ import pytest
 from amtsguide_readiness_spec.validators.work_product import WorkProductValidator
 
 
+# Shared, never mutated: validate() does not modify its input
+_GOOD_METADATA = {
+    "extraction_date": "2025-01-15T10:00:00Z",
+    "model": "test-model",
+    "extractor_version": "1.0"
+}
+
+
 class TestWorkProductValidator:
     """Test suite for WorkProductValidator."""
 
-    def test_valid_work_product_passes(self, valid_work_product, sample_config):
+    def test_valid_work_product_passes(self, valid_work_product, default_validator):
         """Valid work product should pass validation."""
-        validator = WorkProductValidator(sample_config)
-        result = validator.validate(valid_work_product)
+        result = default_validator.validate(valid_work_product)
         
         assert result.passed is True
         assert len(result.errors) == 0
 
-    def test_missing_metadata_fails(self, work_product_missing_metadata, sample_config):
+    def test_missing_metadata_fails(self, work_product_missing_metadata, default_validator):
         """Work product without _metadata should fail."""
-        validator = WorkProductValidator(sample_config)
-        result = validator.validate(work_product_missing_metadata)
+        result = default_validator.validate(work_product_missing_metadata)
         
         assert result.passed is False
-        assert any("_metadata" in error for error in result.errors)
+        assert "_metadata" in "\n".join(result.errors)
 
-    def test_missing_verified_at_fails(self, work_product_missing_verified_at, sample_config):
-        """Work product missing *_verified_at should fail."""
-        validator = WorkProductValidator(sample_config)
-        result = validator.validate(work_product_missing_verified_at)
-        
-        assert result.passed is False
-        assert any("verified_at" in error.lower() for error in result.errors)
-
-    def test_non_fact_fields_are_ignored(self, sample_config):
-        """Fields in non_fact_fields should not require provenance."""
+    def test_missing_metadata_stops_validation(self, default_validator):
+        """Without _metadata, field provenance is not checked."""
         work_product = {
-            "_metadata": {
-                "extraction_date": "2025-01-15T10:00:00Z",
-                "model": "test-model",
-                "extractor_version": "1.0"
-            },
-            "id": "test-id",
-            "name": "Test Name",
-            "notes": "This is a note without provenance - should be OK"
+            "fee": 25,
+            "fee_verified_at": "January 15, 2025"  # Would be an invalid date
         }
         
-        # Configure 'notes' as non-fact field
-        config = {
-            "field_policy": {
-                "identity_fields": ["id", "name"],
-                "non_fact_fields": ["notes"],
-                "missing_verified_at_severity": "error"
-            }
-        }
+        result = default_validator.validate(work_product)
+        
+        assert result.passed is False
+        assert result.errors == ["Missing _metadata block"]
+        assert result.warnings == []
+
+    def test_missing_verified_at_fails(self, work_product_missing_verified_at, default_validator):
+        """Work product missing *_verified_at should fail."""
+        result = default_validator.validate(work_product_missing_verified_at)
         
+        assert result.passed is False
+        assert "verified_at" in "\n".join(result.errors).lower()
+
+    @pytest.mark.parametrize(
+        "work_product, config, passes, needle, bucket",
+        [
+            pytest.param(
+                {
+                    "_metadata": _GOOD_METADATA,
+                    "id": "test-id",
+                    "name": "Test Name",
+                    "notes": "This is a note without provenance - should be OK"
+                },
+                {
+                    "field_policy": {
+                        "identity_fields": ["id", "name"],
+                        "non_fact_fields": ["notes"],
+                        "missing_verified_at_severity": "error"
+                    }
+                },
+                True, None, None,
+                id="non_fact_fields_are_ignored",
+            ),
+            pytest.param(
+                {
+                    "_metadata": _GOOD_METADATA,
+                    "id": "test-id",
+                    "slug": "test-slug"
+                },
+                {
+                    "field_policy": {
+                        "identity_fields": ["id", "slug"],
+                        "non_fact_fields": [],
+                        "missing_verified_at_severity": "error"
+                    }
+                },
+                True, None, None,
+                id="identity_fields_are_ignored",
+            ),
+            pytest.param(
+                {
+                    "_metadata": _GOOD_METADATA,
+                    "fee": 25,
+                    "fee_source": "https://example.gov/fees",
+                    "fee_verified_at": "January 15, 2025"  # Wrong format
+                },
+                None,
+                False, "invalid date format", "errors",
+                id="invalid_date_format_fails",
+            ),
+            pytest.param(
+                {
+                    "_metadata": _GOOD_METADATA,
+                    "fee": 25,
+                    "fee_verified_at": "2025-01-15"
+                    # Missing fee_source
+                },
+                {
+                    "field_policy": {
+                        "identity_fields": [],
+                        "non_fact_fields": [],
+                        "missing_source_severity": "warning",
+                        "missing_verified_at_severity": "error"
+                    }
+                },
+                True, "field 'fee' missing source key (fee_source)", "warnings",
+                id="missing_source_is_warning_by_default",
+            ),
+            pytest.param(
+                {"_metadata": {**_GOOD_METADATA, "model": ""}},  # Empty model
+                None,
+                False, "model", "errors",
+                id="empty_metadata_fields_fail",
+            ),
+        ],
+    )
+    def test_field_rules(self, work_product, config, passes, needle, bucket):
+        """Provenance and metadata rules decide pass/fail and what is reported."""
         validator = WorkProductValidator(config)
         result = validator.validate(work_product)
         
-        assert result.passed is True
-        assert len(result.errors) == 0
+        assert result.passed is passes
+        if passes:
+            assert len(result.errors) == 0
+        if needle:
+            assert needle in "\n".join(getattr(result, bucket)).lower()
+            # Reported once, in the expected bucket only
+            assert len(getattr(result, bucket)) == 1
+            other_bucket = "warnings" if bucket == "errors" else "errors"
+            assert needle not in "\n".join(getattr(result, other_bucket)).lower()
 
-    def test_identity_fields_are_ignored(self, sample_config):
-        """Fields in identity_fields should not require provenance."""
+    def test_missing_and_empty_metadata_fields_are_distinguished(self):
+        """Absent metadata fields are reported as missing, falsy ones as empty."""
         work_product = {
             "_metadata": {
                 "extraction_date": "2025-01-15T10:00:00Z",
-                "model": "test-model",
-                "extractor_version": "1.0"
-            },
-            "id": "test-id",
-            "slug": "test-slug"
-        }
-        
-        config = {
-            "field_policy": {
-                "identity_fields": ["id", "slug"],
-                "non_fact_fields": [],
-                "missing_verified_at_severity": "error"
+                "model": None,
             }
         }
         
-        validator = WorkProductValidator(config)
+        validator = WorkProductValidator()
         result = validator.validate(work_product)
         
-        assert result.passed is True
+        assert "Empty metadata field: model" in result.errors
+        assert "Missing metadata field: extractor_version" in result.errors
 
-    def test_invalid_date_format_fails(self, sample_config):
-        """Invalid date format in *_verified_at should fail."""
+    def test_field_policy_applies_per_validator(self):
+        """Same-shaped work products should be classified per validator policy."""
         work_product = {
-            "_metadata": {
-                "extraction_date": "2025-01-15T10:00:00Z",
-                "model": "test-model",
-                "extractor_version": "1.0"
-            },
+            "_metadata": _GOOD_METADATA,
+            "id": "test-id",
             "fee": 25,
             "fee_source": "https://example.gov/fees",
-            "fee_verified_at": "January 15, 2025"  # Wrong format
+            "fee_verified_at": "2025-01-15"
         }
         
-        validator = WorkProductValidator(sample_config)
-        result = validator.validate(work_product)
+        strict = WorkProductValidator({"field_policy": {"identity_fields": []}})
+        lenient = WorkProductValidator({"field_policy": {"identity_fields": ["id"]}})
         
-        assert result.passed is False
-        assert any("invalid date format" in error.lower() for error in result.errors)
+        for _ in range(2):
+            assert strict.validate(work_product).passed is False
+            assert lenient.validate(work_product).passed is True
 
-    def test_missing_source_is_warning_by_default(self):
-        """Missing source should be a warning, not error, by default."""
+    @pytest.mark.parametrize(
+        "require_source, source_exceptions, expected_passed",
+        [
+            ("all", [], False),
+            ("all", ["office"], True),
+            ("numbers_only", [], True),
+            ("none", [], True),
+        ],
+    )
+    def test_require_source_policy(self, require_source, source_exceptions, expected_passed):
+        """require_source decides which fields need a non-empty source value."""
         work_product = {
-            "_metadata": {
-                "extraction_date": "2025-01-15T10:00:00Z",
-                "model": "test-model",
-                "extractor_version": "1.0"
-            },
-            "fee": 25,
-            "fee_verified_at": "2025-01-15"
-            # Missing fee_source
+            "_metadata": _GOOD_METADATA,
+            "office": "Bürgeramt Mitte",
+            "office_source": "",
+            "office_verified_at": "2025-01-15"
         }
         
         config = {
             "field_policy": {
-                "identity_fields": [],
-                "non_fact_fields": [],
-                "missing_source_severity": "warning",
-                "missing_verified_at_severity": "error"
+                "require_source": require_source,
+                "source_exceptions": source_exceptions,
+                "missing_source_severity": "error"
             }
         }
         
         validator = WorkProductValidator(config)
         result = validator.validate(work_product)
         
-        # Should pass (warning, not error)
-        assert result.passed is False or len(result.warnings) > 0
-        # The missing source key should cause a warning
-        assert any("source" in w.lower() for w in result.warnings) or \
-               any("source" in e.lower() for e in result.errors)
+        assert result.passed is expected_passed
 
-    def test_empty_metadata_fields_fail(self):
-        """Empty required metadata fields should fail."""
+    def test_boolean_fields_do_not_require_source_value(self):
+        """Under numbers_only, booleans are not treated as numbers."""
         work_product = {
-            "_metadata": {
-                "extraction_date": "2025-01-15T10:00:00Z",
-                "model": "",  # Empty
-                "extractor_version": "1.0"
-            }
+            "_metadata": _GOOD_METADATA,
+            "online_booking": True,
+            "online_booking_source": "",
+            "online_booking_verified_at": "2025-01-15",
+            "fee": 25,
+            "fee_source": "",
+            "fee_verified_at": "2025-01-15"
         }
         
-        validator = WorkProductValidator()
+        config = {"field_policy": {"require_source": "numbers_only"}}
+        
+        validator = WorkProductValidator(config)
         result = validator.validate(work_product)
         
-        assert result.passed is False
-        assert any("model" in error.lower() for error in result.errors)
-
+        warnings = "\n".join(result.warnings)
+        assert "'fee'" in warnings
+        assert "online_booking" not in warnings